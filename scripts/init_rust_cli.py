@@ -6,14 +6,23 @@ Creates a new Rust CLI project with proper structure for API wrappers,
 including Claude Code skill integration.
 
 Usage:
-    init_rust_cli.py <cli-name> --api-name <ApiName> --path <output-dir>
+    init_rust_cli.py <cli-name> --api-name <ApiName> --path <output-dir> [--warm]
+        [--profile-preset fast-build,small,pgo] [--allocator mimalloc] [--local-store]
+    init_rust_cli.py --warm <project-dir>... [--vendor] [--fetch-only] [--cache-dir DIR]
 
 Examples:
     init_rust_cli.py notion-cli --api-name Notion --path ~/projects
-    init_rust_cli.py stripe-cli --api-name Stripe --path .
+    init_rust_cli.py stripe-cli --api-name Stripe --path . --profile-preset small --allocator mimalloc
+    init_rust_cli.py --warm ~/projects/notion-cli ~/projects/stripe-cli --vendor
 """
 
+import json
+import os
+import shlex
+import shutil
+import subprocess
 import sys
+import time
 from pathlib import Path
 
 # Template: Cargo.toml
@@ -53,8 +62,8 @@ tracing-subscriber = {{ version = "0.3", features = ["env-filter"] }}
 
 # Streaming
 futures = "0.3"
-
-[profile.release]
+{store_dependency}{allocator_dependency}
+{store_features}[profile.release]
 opt-level = 3
 lto = true
 codegen-units = 1
@@ -65,13 +74,13 @@ strip = true
 MAIN_RS = '''mod cli;
 mod config;
 mod format;
-mod {api_module};
+{main_store_mod}mod {api_module};
 
 use anyhow::{{Context, Result}};
 use clap::Parser;
 use cli::{{Cli, Command, ConfigAction}};
 use std::io::{{self, Write}};
-
+{global_allocator}
 #[tokio::main]
 async fn main() -> Result<()> {{
     let cli = Cli::parse();
@@ -88,35 +97,42 @@ async fn main() -> Result<()> {{
         return handle_config_action(action, cli.json);
     }}
 
-    dotenvy::dotenv().ok();
+{run_local_call}    dotenvy::dotenv().ok();
 
     let config = config::Config::load(cli.config, cli.api_key)?;
-    let client = {api_module}::Client::new(&config)?;
+    let client = {api_module}::Client::new(&config, &cli.profile)?;
 
     match cli.command {{
-        Command::Get {{ id, format }} => {{
-            let result = client.get(&id).await?;
-            format::print_result(&result, cli.json, format);
+        Command::Get {{ ids, format, .. }} => {{
+            let projection = format::Projection::new(&cli.fields, &[])?;
+            if let [id] = ids.as_slice() {{
+                let result = client.get(id, &projection).await?;
+                format::print_result(&result, cli.json, format);
+            }} else {{
+                let results = client.get_many(&ids, &projection).await?;
+                format::print_results(&results, cli.json);
+            }}
         }}
-        Command::Search {{ query, limit, all }} => {{
-            // TODO: Implement streaming with --all flag
-            // See references/rust-cli-patterns.md for pagination patterns
+        Command::Search {{ query, limit, all, filter, .. }} => {{
+            // TODO: Implement streaming
+            // See references/rust-cli-patterns.md for streaming patterns
             if cli.stream {{
                 eprintln!("Streaming not yet implemented. Use --json for now.");
             }}
-            if all {{
-                // TODO: Implement paginated fetch with search_all()
-                eprintln!("--all pagination not yet implemented.");
-            }}
-            let results = client.search(&query, limit).await?;
+            let projection = format::Projection::new(&cli.fields, &filter)?;
+            let results = if all {{
+                client.search_all(&query, None, &projection).await?
+            }} else {{
+                client.search(&query, limit, &projection).await?
+            }};
             format::print_results(&results, cli.json);
         }}
-        Command::Config {{ .. }} => unreachable!(),
+{sync_arm}        Command::Config {{ .. }} => unreachable!(),
     }}
 
     Ok(())
 }}
-
+{run_local_fn}
 fn handle_config_action(action: &ConfigAction, as_json: bool) -> Result<()> {{
     match action {{
         ConfigAction::Init {{ api_key, force }} => init_config(api_key.clone(), *force),
@@ -191,7 +207,7 @@ pub struct Cli {{
     #[command(subcommand)]
     pub command: Command,
 
-    #[arg(long, env = "{env_var}", global = true, hide_env_values = true)]
+    #[arg(long, global = true, help = "API key for every profile (default: {env_var} or config)")]
     pub api_key: Option<String>,
 
     #[arg(long, short, global = true)]
@@ -205,18 +221,34 @@ pub struct Cli {{
 
     #[arg(long, global = true, help = "Stream response in real-time")]
     pub stream: bool,
+
+    #[arg(
+        long,
+        global = true,
+        value_delimiter = ',',
+        help = "Only output these fields (e.g. id,owner.login)"
+    )]
+    pub fields: Vec<String>,
+
+    #[arg(
+        long,
+        global = true,
+        value_delimiter = ',',
+        help = "Config profile(s) to send requests through"
+    )]
+    pub profile: Vec<String>,
 }}
 
 #[derive(Subcommand)]
 pub enum Command {{
-    #[command(about = "Get an item by ID")]
+    #[command(about = "Get items by ID")]
     Get {{
-        #[arg(help = "Item ID")]
-        id: String,
+        #[arg(required = true, help = "Item ID(s), fetched concurrently")]
+        ids: Vec<String>,
 
         #[arg(long, value_enum, default_value = "json")]
         format: OutputFormat,
-    }},
+{get_local_arg}    }},
 
     #[command(about = "Search for items")]
     Search {{
@@ -228,9 +260,12 @@ pub enum Command {{
 
         #[arg(long, help = "Fetch all results")]
         all: bool,
-    }},
 
-    #[command(about = "Configuration management")]
+        #[arg(long, help = "Keep results matching key=value, key!=value or key~text")]
+        filter: Vec<String>,
+{search_local_arg}    }},
+
+{sync_command}    #[command(about = "Configuration management")]
     Config {{
         #[command(subcommand)]
         action: ConfigAction,
@@ -266,6 +301,7 @@ pub enum OutputFormat {{
 # Template: config.rs
 CONFIG_RS = '''use anyhow::{{Context, Result}};
 use serde::{{Deserialize, Serialize}};
+use std::collections::BTreeMap;
 use std::path::PathBuf;
 
 #[derive(Debug, Clone, Serialize, Deserialize, Default)]
@@ -276,14 +312,53 @@ pub struct Config {{
     #[serde(skip_serializing_if = "Option::is_none")]
     pub domain: Option<String>,
 
+    #[serde(default, skip_serializing_if = "BTreeMap::is_empty")]
+    pub profiles: BTreeMap<String, Profile>,
+
     #[serde(default)]
     pub defaults: Defaults,
+
+    /// Set when `api_key` came from the CLI flag or environment, which
+    /// outrank every key in the config file, including profile keys.
+    #[serde(skip)]
+    pub api_key_overridden: bool,
+}}
+
+/// A named key/endpoint pair (`[profiles.<name>]`) for the client pool.
+/// Unset `api_key`/`domain` fall back to the top-level values.
+#[derive(Debug, Clone, Serialize, Deserialize, Default)]
+pub struct Profile {{
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub api_key: Option<String>,
+
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub domain: Option<String>,
+
+    /// Maximum in-flight requests through this profile
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub concurrency: Option<usize>,
+
+    /// Maximum requests per minute through this profile
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub rate_per_minute: Option<u32>,
 }}
 
 #[derive(Debug, Clone, Serialize, Deserialize, Default)]
 pub struct Defaults {{
     #[serde(default = "default_limit")]
     pub limit: u32,
+
+    #[serde(default)]
+    pub balance: Balance,
+}}
+
+/// How the client spreads requests over the selected profiles.
+#[derive(Debug, Clone, Copy, Serialize, Deserialize, Default, PartialEq, Eq)]
+#[serde(rename_all = "kebab-case")]
+pub enum Balance {{
+    #[default]
+    RoundRobin,
+    LeastLoaded,
 }}
 
 fn default_limit() -> u32 {{
@@ -319,14 +394,13 @@ impl Config {{
             Config::default()
         }};
 
-        // CLI flag override (highest priority)
+        // CLI flag override (highest priority), also for every profile
         if let Some(key) = api_key_override {{
             config.api_key = Some(key);
-        }}
-
-        // Environment variable fallback
-        if config.api_key.is_none() {{
-            config.api_key = std::env::var("{env_var}").ok();
+            config.api_key_overridden = true;
+        }} else if let Ok(key) = std::env::var("{env_var}") {{
+            // Environment variable: top-level key and profiles without one
+            config.api_key = Some(key);
         }}
 
         Ok(config)
@@ -340,7 +414,19 @@ impl Config {{
         let masked = Config {{
             api_key: self.api_key.as_ref().map(|k| mask_key(k)),
             domain: self.domain.clone(),
+            profiles: self
+                .profiles
+                .iter()
+                .map(|(name, p)| {{
+                    let profile = Profile {{
+                        api_key: p.api_key.as_ref().map(|k| mask_key(k)),
+                        ..p.clone()
+                    }};
+                    (name.clone(), profile)
+                }})
+                .collect(),
             defaults: self.defaults.clone(),
+            api_key_overridden: self.api_key_overridden,
         }};
 
         if as_json {{
@@ -372,6 +458,55 @@ impl Config {{
             .as_deref()
             .context("API key not configured. Run '{cli_name} config init' or set {env_var}")
     }}
+
+    /// Resolve the profiles the client pool sends requests through.
+    ///
+    /// Named profiles must exist. With no names, every configured profile is
+    /// used, or a single "default" profile built from the top-level settings.
+    /// A key from `--api-key` replaces every profile key; profiles without a
+    /// key use the top-level one (`{env_var}` or the config file).
+    pub fn select_profiles(&self, names: &[String]) -> Result<Vec<(String, Profile)>> {{
+        let selected: Vec<(String, Profile)> = if !names.is_empty() {{
+            names
+                .iter()
+                .map(|name| {{
+                    let profile = self
+                        .profiles
+                        .get(name)
+                        .with_context(|| format!("Unknown profile: '{{}}'", name))?;
+                    Ok((name.clone(), profile.clone()))
+                }})
+                .collect::<Result<_>>()?
+        }} else if self.profiles.is_empty() {{
+            vec![("default".to_string(), Profile::default())]
+        }} else {{
+            self.profiles
+                .iter()
+                .map(|(name, p)| (name.clone(), p.clone()))
+                .collect()
+        }};
+
+        selected
+            .into_iter()
+            .map(|(name, mut profile)| {{
+                if self.api_key_overridden {{
+                    if profile.api_key.is_some() {{
+                        tracing::warn!(
+                            "--api-key overrides the API key of profile '{{}}'",
+                            name
+                        );
+                    }}
+                    profile.api_key = self.api_key.clone();
+                }} else if profile.api_key.is_none() {{
+                    profile.api_key = Some(self.get_api_key()?.to_string());
+                }}
+                if profile.domain.is_none() {{
+                    profile.domain = self.domain.clone();
+                }}
+                Ok((name, profile))
+            }})
+            .collect()
+    }}
 }}
 
 fn mask_key(key: &str) -> String {{
@@ -385,8 +520,12 @@ fn mask_key(key: &str) -> String {{
 
 # Template: format.rs
 FORMAT_RS = '''use crate::cli::OutputFormat;
-use serde::Serialize;
-use serde_json::Value;
+use anyhow::{{Context, Result}};
+use serde::de::{{self, DeserializeSeed, IgnoredAny, MapAccess, SeqAccess, Visitor}};
+use serde::{{Deserialize, Serialize}};
+use serde_json::{{Map, Value}};
+use std::collections::BTreeMap;
+use std::fmt;
 
 pub fn print_result<T: Serialize>(result: &T, as_json: bool, _format: OutputFormat) {{
     if as_json {{
@@ -452,13 +591,714 @@ fn format_scalar(value: &Value) -> String {{
         _ => value.to_string(),
     }}
 }}
+
+/// Field selection (`--fields a,b.c`) and row filters (`--filter key=value`)
+/// applied while the response body is deserialized. Unselected subtrees are
+/// skipped by the parser and never allocated.
+#[derive(Debug, Default)]
+pub struct Projection {{
+    fields: Option<FieldTree>,
+    filters: Vec<Filter>,
+    /// Union of `fields` and filter paths: what the parser has to keep.
+    keep: Option<FieldTree>,
+    /// Filters kept paths outside `fields` that must be dropped after matching.
+    trim: bool,
+}}
+
+impl Projection {{
+    pub fn new(fields: &[String], filters: &[String]) -> Result<Self> {{
+        let fields = if fields.is_empty() {{
+            None
+        }} else {{
+            let mut tree = FieldTree::default();
+            for path in fields {{
+                tree.insert(path)?;
+            }}
+            Some(tree)
+        }};
+
+        let filters = filters
+            .iter()
+            .map(|f| Filter::parse(f))
+            .collect::<Result<Vec<_>>>()?;
+
+        let keep = fields.clone().map(|mut tree| {{
+            for filter in &filters {{
+                tree.insert_path(&filter.path);
+            }}
+            tree
+        }});
+        let trim = keep != fields;
+
+        Ok(Self {{ fields, filters, keep, trim }})
+    }}
+
+    /// Deserialize a single object, keeping only the selected fields.
+    pub fn parse_one(&self, text: &str) -> Result<Value> {{
+        let mut de = serde_json::Deserializer::from_str(text);
+        let value = Pruned(self.fields.as_ref())
+            .deserialize(&mut de)
+            .context("Failed to parse response")?;
+        de.end().context("Failed to parse response")?;
+        Ok(value)
+    }}
+
+    /// Deserialize the array stored under `key` in the response object,
+    /// dropping rows that fail a filter. Sibling keys are skipped unparsed.
+    pub fn parse_list(&self, text: &str, key: &str) -> Result<Vec<Value>> {{
+        Ok(self.parse_page(text, key)?.rows)
+    }}
+
+    /// Like `parse_list`, also returning the response's `next_cursor`.
+    pub fn parse_page(&self, text: &str, key: &str) -> Result<Page> {{
+        let mut de = serde_json::Deserializer::from_str(text);
+        let page = PageSeed {{ key, projection: self }}
+            .deserialize(&mut de)
+            .context("Failed to parse response")?;
+        de.end().context("Failed to parse response")?;
+        Ok(page)
+    }}
+{parse_row}
+    fn accept(&self, mut row: Value) -> Option<Value> {{
+        if !self.filters.iter().all(|f| f.matches(&row)) {{
+            return None;
+        }}
+        // Filter-only paths were kept for matching; drop them from the output.
+        if self.trim {{
+            if let Some(fields) = &self.fields {{
+                fields.retain(&mut row);
+            }}
+        }}
+        Some(row)
+    }}
+}}
+
+/// One page of a list response.
+#[derive(Debug, Default)]
+pub struct Page {{
+    pub rows: Vec<Value>,
+    pub next_cursor: Option<String>,
+}}
+
+/// Nested field selection. A node without children keeps the whole subtree.
+#[derive(Debug, Default, Clone, PartialEq)]
+struct FieldTree {{
+    children: BTreeMap<String, FieldTree>,
+}}
+
+impl FieldTree {{
+    fn insert(&mut self, path: &str) -> Result<()> {{
+        let path = path.trim();
+        if path.is_empty() || path.split('.').any(str::is_empty) {{
+            anyhow::bail!("Invalid field path: '{{}}'", path);
+        }}
+        self.insert_path(path);
+        Ok(())
+    }}
+
+    fn insert_path(&mut self, path: &str) {{
+        let mut node = self;
+        let mut parts = path.split('.').peekable();
+        while let Some(part) = parts.next() {{
+            let is_new = !node.children.contains_key(part);
+            let child = node.children.entry(part.to_string()).or_default();
+            if parts.peek().is_none() {{
+                // `a` after `a.b` widens the selection to all of `a`
+                child.children.clear();
+            }} else if !is_new && child.children.is_empty() {{
+                // `a.b` after `a` is already covered
+                return;
+            }}
+            node = child;
+        }}
+    }}
+
+    fn retain(&self, value: &mut Value) {{
+        if self.children.is_empty() {{
+            return;
+        }}
+        match value {{
+            Value::Object(map) => {{
+                map.retain(|key, val| match self.children.get(key) {{
+                    Some(child) => {{
+                        child.retain(val);
+                        true
+                    }}
+                    None => false,
+                }});
+            }}
+            Value::Array(items) => items.iter_mut().for_each(|item| self.retain(item)),
+            _ => {{}}
+        }}
+    }}
+}}
+
+#[derive(Debug)]
+struct Filter {{
+    path: String,
+    op: FilterOp,
+    value: String,
+}}
+
+#[derive(Debug, Clone, Copy)]
+enum FilterOp {{
+    Eq,
+    Ne,
+    Contains,
+}}
+
+impl Filter {{
+    /// Parse `path=value`, `path!=value` or `path~substring`.
+    fn parse(expr: &str) -> Result<Self> {{
+        // Split at the first operator so values may contain `=`, `!=` or `~`
+        let (idx, op, len) = expr
+            .char_indices()
+            .find_map(|(i, c)| match c {{
+                '!' if expr[i + 1..].starts_with('=') => Some((i, FilterOp::Ne, 2)),
+                '~' => Some((i, FilterOp::Contains, 1)),
+                '=' => Some((i, FilterOp::Eq, 1)),
+                _ => None,
+            }})
+            .with_context(|| {{
+                format!("Invalid filter: '{{}}' (expected key=value, key!=value or key~text)", expr)
+            }})?;
+        let (path, value) = (&expr[..idx], &expr[idx + len..]);
+
+        let path = path.trim();
+        if path.is_empty()
+            || path.split('.').any(str::is_empty)
+            || path.contains(['=', '!', '~'])
+        {{
+            anyhow::bail!("Invalid filter path: '{{}}'", expr);
+        }}
+
+        Ok(Self {{
+            path: path.to_string(),
+            op,
+            value: value.trim().to_string(),
+        }})
+    }}
+
+    /// Like `--fields`, the path passes through arrays: `tags.k=v` matches
+    /// when any element has `k` equal to `v`, and `!=` when none does.
+    fn matches(&self, row: &Value) -> bool {{
+        match self.op {{
+            FilterOp::Eq => any_at(row, &self.path, &|s| s == self.value),
+            FilterOp::Ne => !any_at(row, &self.path, &|s| s == self.value),
+            FilterOp::Contains => any_at(row, &self.path, &|s| s.contains(&self.value)),
+        }}
+    }}
+}}
+
+/// Whether any scalar reached by `path` satisfies `pred`, fanning out
+/// over arrays along the way.
+fn any_at(value: &Value, path: &str, pred: &dyn Fn(&str) -> bool) -> bool {{
+    match value {{
+        Value::Array(items) => items.iter().any(|item| any_at(item, path, pred)),
+        _ if path.is_empty() => pred(&format_scalar(value)),
+        _ => {{
+            let (key, rest) = path.split_once('.').unwrap_or((path, ""));
+            value.get(key).is_some_and(|v| any_at(v, rest, pred))
+        }}
+    }}
+}}
+
+/// Deserializes any JSON value, skipping object keys outside the tree.
+struct Pruned<'a>(Option<&'a FieldTree>);
+
+impl<'de> DeserializeSeed<'de> for Pruned<'_> {{
+    type Value = Value;
+
+    fn deserialize<D: de::Deserializer<'de>>(self, deserializer: D) -> Result<Value, D::Error> {{
+        match self.0 {{
+            Some(tree) if !tree.children.is_empty() => deserializer.deserialize_any(PrunedVisitor(tree)),
+            _ => Value::deserialize(deserializer),
+        }}
+    }}
+}}
+
+struct PrunedVisitor<'a>(&'a FieldTree);
+
+impl<'de> Visitor<'de> for PrunedVisitor<'_> {{
+    type Value = Value;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {{
+        f.write_str("any JSON value")
+    }}
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Value, A::Error> {{
+        let mut out = Map::new();
+        while let Some(found) = map.next_key_seed(FieldKey(self.0))? {{
+            match found {{
+                Some((key, child)) => {{
+                    let value = map.next_value_seed(Pruned(Some(child)))?;
+                    out.insert(key, value);
+                }}
+                None => {{
+                    map.next_value::<IgnoredAny>()?;
+                }}
+            }}
+        }}
+        Ok(Value::Object(out))
+    }}
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Value, A::Error> {{
+        // Arrays are transparent: the selection applies to each element.
+        let mut out = Vec::new();
+        while let Some(value) = seq.next_element_seed(Pruned(Some(self.0)))? {{
+            out.push(value);
+        }}
+        Ok(Value::Array(out))
+    }}
+
+    fn visit_bool<E>(self, v: bool) -> Result<Value, E> {{
+        Ok(Value::Bool(v))
+    }}
+
+    fn visit_i64<E>(self, v: i64) -> Result<Value, E> {{
+        Ok(v.into())
+    }}
+
+    fn visit_u64<E>(self, v: u64) -> Result<Value, E> {{
+        Ok(v.into())
+    }}
+
+    fn visit_f64<E>(self, v: f64) -> Result<Value, E> {{
+        Ok(v.into())
+    }}
+
+    fn visit_str<E>(self, v: &str) -> Result<Value, E> {{
+        Ok(Value::String(v.to_string()))
+    }}
+
+    fn visit_string<E>(self, v: String) -> Result<Value, E> {{
+        Ok(Value::String(v))
+    }}
+
+    fn visit_unit<E>(self) -> Result<Value, E> {{
+        Ok(Value::Null)
+    }}
+
+    fn visit_none<E>(self) -> Result<Value, E> {{
+        Ok(Value::Null)
+    }}
+}}
+
+/// Matches an object key against the tree without allocating skipped keys.
+struct FieldKey<'a>(&'a FieldTree);
+
+impl<'de, 'a> DeserializeSeed<'de> for FieldKey<'a> {{
+    type Value = Option<(String, &'a FieldTree)>;
+
+    fn deserialize<D: de::Deserializer<'de>>(self, deserializer: D) -> Result<Self::Value, D::Error> {{
+        deserializer.deserialize_str(self)
+    }}
+}}
+
+impl<'de, 'a> Visitor<'de> for FieldKey<'a> {{
+    type Value = Option<(String, &'a FieldTree)>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {{
+        f.write_str("an object key")
+    }}
+
+    fn visit_str<E>(self, v: &str) -> Result<Self::Value, E> {{
+        Ok(self.0.children.get(v).map(|child| (v.to_string(), child)))
+    }}
+}}
+
+/// Walks the top-level response object down to the `key` array and the
+/// `next_cursor` string.
+struct PageSeed<'a> {{
+    key: &'a str,
+    projection: &'a Projection,
+}}
+
+impl<'de> DeserializeSeed<'de> for PageSeed<'_> {{
+    type Value = Page;
+
+    fn deserialize<D: de::Deserializer<'de>>(self, deserializer: D) -> Result<Page, D::Error> {{
+        deserializer.deserialize_map(self)
+    }}
+}}
+
+impl<'de> Visitor<'de> for PageSeed<'_> {{
+    type Value = Page;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {{
+        write!(f, "an object with a '{{}}' array", self.key)
+    }}
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Page, A::Error> {{
+        let mut page = Page::default();
+        while let Some(field) = map.next_key_seed(PageKey(self.key))? {{
+            match field {{
+                PageField::Rows => page.rows = map.next_value_seed(RowsSeed(self.projection))?,
+                PageField::Cursor => page.next_cursor = map.next_value()?,
+                PageField::Other => {{
+                    map.next_value::<IgnoredAny>()?;
+                }}
+            }}
+        }}
+        Ok(page)
+    }}
+}}
+
+enum PageField {{
+    Rows,
+    Cursor,
+    Other,
+}}
+
+struct PageKey<'a>(&'a str);
+
+impl<'de> DeserializeSeed<'de> for PageKey<'_> {{
+    type Value = PageField;
+
+    fn deserialize<D: de::Deserializer<'de>>(self, deserializer: D) -> Result<PageField, D::Error> {{
+        deserializer.deserialize_str(self)
+    }}
+}}
+
+impl<'de> Visitor<'de> for PageKey<'_> {{
+    type Value = PageField;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {{
+        f.write_str("an object key")
+    }}
+
+    fn visit_str<E>(self, v: &str) -> Result<PageField, E> {{
+        Ok(match v {{
+            _ if v == self.0 => PageField::Rows,
+            "next_cursor" => PageField::Cursor,
+            _ => PageField::Other,
+        }})
+    }}
+}}
+
+struct RowsSeed<'a>(&'a Projection);
+
+impl<'de> DeserializeSeed<'de> for RowsSeed<'_> {{
+    type Value = Vec<Value>;
+
+    fn deserialize<D: de::Deserializer<'de>>(self, deserializer: D) -> Result<Vec<Value>, D::Error> {{
+        deserializer.deserialize_any(self)
+    }}
+}}
+
+impl<'de> Visitor<'de> for RowsSeed<'_> {{
+    type Value = Vec<Value>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {{
+        f.write_str("an array of results")
+    }}
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Vec<Value>, A::Error> {{
+        let mut rows = Vec::new();
+        while let Some(row) = seq.next_element_seed(Pruned(self.0.keep.as_ref()))? {{
+            rows.extend(self.0.accept(row));
+        }}
+        Ok(rows)
+    }}
+
+    fn visit_unit<E>(self) -> Result<Vec<Value>, E> {{
+        Ok(Vec::new())
+    }}
+}}
 '''
 
+# Template: store.rs (local-store feature)
+STORE_RS = '''use anyhow::{{Context, Result}};
+use rusqlite::{{params, Connection, OptionalExtension}};
+use serde::Deserialize;
+use serde_json::Value;
+use std::path::{{Path, PathBuf}};
+use crate::config::Config;
+use crate::{api_module}::Item;
+
+const SCHEMA: &str = "
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    updated_at TEXT,
+    body TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(name, description);
+CREATE TABLE IF NOT EXISTS sync_state (
+    query TEXT PRIMARY KEY,
+    cursor TEXT,
+    synced_at INTEGER NOT NULL
+);
+";
+
+/// Local mirror of synced search results: raw items in SQLite, with an
+/// FTS5 index over `name` and `description` keyed by the item's rowid.
+pub struct Store {{
+    conn: Connection,
+}}
+
+impl Store {{
+    /// `store.db` next to the global config file.
+    pub fn default_path() -> Option<PathBuf> {{
+        Config::default_config_path().and_then(|p| p.parent().map(|dir| dir.join("store.db")))
+    }}
+
+    pub fn open_default() -> Result<Self> {{
+        let path = Self::default_path().context("Cannot determine store path")?;
+        Self::open(&path)
+    }}
+
+    pub fn open(path: &Path) -> Result<Self> {{
+        if let Some(parent) = path.parent() {{
+            std::fs::create_dir_all(parent)?;
+        }}
+        let conn = Connection::open(path)
+            .with_context(|| format!("Failed to open store: {{}}", path.display()))?;
+        conn.execute_batch(SCHEMA).context("Failed to initialize store")?;
+        Ok(Self {{ conn }})
+    }}
+
+    /// Highest `updated_at` stored by the last sync of `query`.
+    pub fn cursor(&self, query: &str) -> Result<Option<String>> {{
+        let cursor = self
+            .conn
+            .query_row(
+                "SELECT cursor FROM sync_state WHERE query = ?1",
+                params![query],
+                |row| row.get(0),
+            )
+            .optional()?;
+        Ok(cursor.flatten())
+    }}
+
+    /// Insert or replace `items` and advance the cursor for `query`, all in
+    /// one transaction. Items that don't match `Item` are skipped.
+    pub fn upsert(&mut self, query: &str, items: &[Value]) -> Result<usize> {{
+        let mut cursor = self.cursor(query)?;
+        let tx = self.conn.transaction()?;
+        let mut count = 0;
+
+        {{
+            let mut upsert_item = tx.prepare_cached(
+                "INSERT INTO items (id, updated_at, body) VALUES (?1, ?2, ?3)
+                 ON CONFLICT(id) DO UPDATE SET updated_at = excluded.updated_at, body = excluded.body
+                 RETURNING rowid",
+            )?;
+            let mut delete_fts = tx.prepare_cached("DELETE FROM items_fts WHERE rowid = ?1")?;
+            let mut insert_fts = tx.prepare_cached(
+                "INSERT INTO items_fts (rowid, name, description) VALUES (?1, ?2, ?3)",
+            )?;
+
+            for value in items {{
+                let item = match Item::deserialize(value) {{
+                    Ok(item) => item,
+                    Err(e) => {{
+                        tracing::warn!("Skipping item: {{}}", e);
+                        continue;
+                    }}
+                }};
+
+                let rowid: i64 = upsert_item.query_row(
+                    params![item.id, item.updated_at, value.to_string()],
+                    |row| row.get(0),
+                )?;
+                delete_fts.execute(params![rowid])?;
+                insert_fts.execute(params![rowid, item.name, item.description])?;
+
+                if item.updated_at > cursor {{
+                    cursor = item.updated_at;
+                }}
+                count += 1;
+            }}
+        }}
+
+        tx.execute(
+            "INSERT INTO sync_state (query, cursor, synced_at) VALUES (?1, ?2, unixepoch())
+             ON CONFLICT(query) DO UPDATE SET cursor = excluded.cursor, synced_at = excluded.synced_at",
+            params![query, cursor],
+        )?;
+        tx.commit()?;
+
+        Ok(count)
+    }}
+
+    /// Raw JSON of a stored item.
+    pub fn get(&self, id: &str) -> Result<Option<String>> {{
+        let body = self
+            .conn
+            .query_row("SELECT body FROM items WHERE id = ?1", params![id], |row| row.get(0))
+            .optional()?;
+        Ok(body)
+    }}
+
+    /// Raw JSON of items matching `query`, best match first.
+    pub fn search(&self, query: &str, limit: Option<u32>) -> Result<Vec<String>> {{
+        let limit = limit.map_or(-1, i64::from);
+        let terms = fts_query(query);
+
+        let bodies = if terms.is_empty() {{
+            let mut stmt = self.conn.prepare_cached("SELECT body FROM items LIMIT ?1")?;
+            let rows = stmt.query_map(params![limit], |row| row.get(0))?;
+            rows.collect::<rusqlite::Result<Vec<String>>>()
+        }} else {{
+            let mut stmt = self.conn.prepare_cached(
+                "SELECT items.body FROM items_fts
+                 JOIN items ON items.rowid = items_fts.rowid
+                 WHERE items_fts MATCH ?1
+                 ORDER BY rank
+                 LIMIT ?2",
+            )?;
+            let rows = stmt.query_map(params![terms, limit], |row| row.get(0))?;
+            rows.collect::<rusqlite::Result<Vec<String>>>()
+        }};
+
+        bodies.context("Failed to query local store")
+    }}
+}}
+
+/// Quote each word so user input is never parsed as FTS5 syntax.
+fn fts_query(query: &str) -> String {{
+    query
+        .split_whitespace()
+        .map(|term| format!("\\"{{}}\\"", term.replace('"', "\\"\\"")))
+        .collect::<Vec<_>>()
+        .join(" ")
+}}
+'''
+
+# Template fragments spliced in with --local-store. They are templates too
+# and are formatted with the same variables before insertion.
+LOCAL_STORE_FRAGMENTS = {
+    'store_dependency': '''
+# Local store
+rusqlite = {{ version = "0.32", features = ["bundled"], optional = true }}
+''',
+    'store_features': '''[features]
+default = ["local-store"]
+local-store = ["dep:rusqlite"]
+
+''',
+    'main_store_mod': '''#[cfg(feature = "local-store")]
+mod store;
+''',
+    'lib_store_mod': '''#[cfg(feature = "local-store")]
+pub mod store;
+''',
+    'run_local_call': '''    #[cfg(feature = "local-store")]
+    if run_local(&cli)? {{
+        return Ok(());
+    }}
+
+''',
+    'sync_arm': '''        #[cfg(feature = "local-store")]
+        Command::Sync {{ query, full }} => {{
+            let mut store = store::Store::open_default()?;
+            let since = if full {{ None }} else {{ store.cursor(&query)? }};
+            let items = client
+                .search_all(&query, since.as_deref(), &format::Projection::default())
+                .await?;
+            let count = store.upsert(&query, &items)?;
+            eprintln!("Synced {{}} item(s) for '{{}}'", count, query);
+        }}
+''',
+    'run_local_fn': '''
+/// Answer `get --local` / `search --local` from the store. Returns false
+/// for anything that needs the API.
+#[cfg(feature = "local-store")]
+fn run_local(cli: &Cli) -> Result<bool> {{
+    match &cli.command {{
+        Command::Get {{ ids, format, local: true }} => {{
+            let store = store::Store::open_default()?;
+            let projection = format::Projection::new(&cli.fields, &[])?;
+            let mut results = Vec::new();
+            for id in ids {{
+                let body = store
+                    .get(id)?
+                    .with_context(|| format!("Item not in local store: {{}}\\nRun 'sync' first", id))?;
+                results.push(projection.parse_one(&body)?);
+            }}
+            match results.as_slice() {{
+                [result] => format::print_result(result, cli.json, *format),
+                _ => format::print_results(&results, cli.json),
+            }}
+            Ok(true)
+        }}
+        Command::Search {{ query, limit, all, filter, local: true }} => {{
+            let store = store::Store::open_default()?;
+            let projection = format::Projection::new(&cli.fields, filter)?;
+            // Filters run after the query, so only let SQLite apply the
+            // limit when every row it returns will be kept.
+            let sql_limit = (!*all && filter.is_empty()).then_some(*limit);
+            let mut results = Vec::new();
+            for body in store.search(query, sql_limit)? {{
+                results.extend(projection.parse_row(&body)?);
+                if !*all && results.len() >= *limit as usize {{
+                    break;
+                }}
+            }}
+            format::print_results(&results, cli.json);
+            Ok(true)
+        }}
+        _ => Ok(false),
+    }}
+}}
+''',
+    'get_local_arg': '''
+        #[cfg(feature = "local-store")]
+        #[arg(long, help = "Read from the local store (see sync)")]
+        local: bool,
+''',
+    'search_local_arg': '''
+        #[cfg(feature = "local-store")]
+        #[arg(long, help = "Search the local store (see sync)")]
+        local: bool,
+''',
+    'sync_command': '''    #[cfg(feature = "local-store")]
+    #[command(about = "Mirror search results into the local store")]
+    Sync {{
+        #[arg(help = "Search query")]
+        query: String,
+
+        #[arg(long, help = "Ignore the saved cursor and re-fetch everything")]
+        full: bool,
+    }},
+
+''',
+    'parse_row': '''
+    /// Project a single stored row; `None` when it fails a filter.
+    #[cfg(feature = "local-store")]
+    pub fn parse_row(&self, text: &str) -> Result<Option<Value>> {{
+        let mut de = serde_json::Deserializer::from_str(text);
+        let row = Pruned(self.keep.as_ref())
+            .deserialize(&mut de)
+            .context("Failed to parse stored item")?;
+        de.end().context("Failed to parse stored item")?;
+        Ok(self.accept(row))
+    }}
+''',
+    'skill_store_commands': '''
+# Mirror results locally, then query offline (local-store feature)
+{cli_name} sync "query"
+{cli_name} search "query" --local --json
+''',
+    'skill_store_options': '''| `--local` | Answer from the local store (after `sync`) |
+''',
+    'claude_store_file': '''├── store.rs         # Local SQLite/FTS5 mirror (local-store feature)
+''',
+    'claude_store_section': '''### Local Store (`local-store` feature)
+`sync <query>` mirrors `search <query> --all` into `store.db` next to the
+global config. Each run only requests items with `updated_at` newer than the
+last sync (`updated_since` query param). `get --local` / `search --local`
+answer from the FTS5 index without an API key. Adjust the param and field
+names in `client.rs` and `types.rs` to match the API.
+
+''',
+}
+
 # Template: lib.rs
 LIB_RS = '''pub mod cli;
 pub mod config;
 pub mod format;
-pub mod {api_module};
+{lib_store_mod}pub mod {api_module};
 '''
 
 # Template: API module mod.rs
@@ -471,18 +1311,195 @@ pub use types::*;
 
 # Template: API client.rs
 API_CLIENT_RS = '''use anyhow::{{Context, Result}};
+use futures::{{StreamExt, TryStreamExt}};
 use reqwest::header::{{HeaderMap, HeaderValue, AUTHORIZATION, CONTENT_TYPE}};
 use serde_json::Value;
-use crate::config::Config;
-
+use std::collections::HashSet;
+use std::sync::atomic::{{AtomicUsize, Ordering}};
+use std::time::Duration;
+use tokio::sync::{{Mutex, Semaphore}};
+use tokio::time::Instant;
+use crate::config::{{Balance, Config, Profile}};
+use crate::format::Projection;
+
+const DEFAULT_CONCURRENCY: usize = 4;
+const PAGE_SIZE: &str = "100";
+
+/// Pool of endpoints, one per selected config profile. Each request goes
+/// through one endpoint, chosen by `defaults.balance`.
 pub struct Client {{
+    endpoints: Vec<Endpoint>,
+    balance: Balance,
+    next: AtomicUsize,
+}}
+
+struct Endpoint {{
+    name: String,
     http: reqwest::Client,
     base_url: String,
+    concurrency: usize,
+    permits: Semaphore,
+    limiter: Option<RateLimiter>,
 }}
 
 impl Client {{
-    pub fn new(config: &Config) -> Result<Self> {{
-        let api_key = config.get_api_key()?;
+    pub fn new(config: &Config, profiles: &[String]) -> Result<Self> {{
+        let endpoints = config
+            .select_profiles(profiles)?
+            .into_iter()
+            .map(|(name, profile)| Endpoint::new(name, &profile))
+            .collect::<Result<Vec<_>>>()?;
+
+        Ok(Self {{
+            endpoints,
+            balance: config.defaults.balance,
+            next: AtomicUsize::new(0),
+        }})
+    }}
+
+    pub async fn get(&self, id: &str, projection: &Projection) -> Result<Value> {{
+        let text = self
+            .send(|ep| ep.http.get(format!("{{}}/items/{{}}", ep.base_url, id)))
+            .await?;
+        projection.parse_one(&text)
+    }}
+
+    /// Fetch several items concurrently, spread over the endpoint pool.
+    /// Results keep the order of `ids`; the first error aborts the batch.
+    pub async fn get_many(&self, ids: &[String], projection: &Projection) -> Result<Vec<Value>> {{
+        futures::stream::iter(ids)
+            .map(|id| self.get(id, projection))
+            .buffered(self.concurrency())
+            .try_collect()
+            .await
+    }}
+
+    pub async fn search(&self, query: &str, limit: u32, projection: &Projection) -> Result<Vec<Value>> {{
+        let limit = limit.to_string();
+        let text = self
+            .send(|ep| {{
+                ep.http
+                    .get(format!("{{}}/search", ep.base_url))
+                    .query(&[("q", query), ("limit", &limit)])
+            }})
+            .await?;
+        projection.parse_list(&text, "results")
+    }}
+
+    /// Fetch every page of `query`, following `next_cursor` until it is
+    /// missing, empty or repeated. With `updated_since`, only items changed
+    /// after that timestamp are requested.
+    pub async fn search_all(
+        &self,
+        query: &str,
+        updated_since: Option<&str>,
+        projection: &Projection,
+    ) -> Result<Vec<Value>> {{
+        let mut all_results = Vec::new();
+        let mut cursor: Option<String> = None;
+        let mut seen = HashSet::new();
+
+        // Cursors are usually tied to the key and region that issued them,
+        // so every page of one walk goes through the same endpoint.
+        let endpoint = self.pick();
+
+        loop {{
+            let text = self
+                .send_via(endpoint, |ep| {{
+                    let mut request = ep.http
+                        .get(format!("{{}}/search", ep.base_url))
+                        .query(&[("q", query), ("limit", PAGE_SIZE)]);
+                    if let Some(since) = updated_since {{
+                        request = request.query(&[("updated_since", since)]);
+                    }}
+                    if let Some(c) = &cursor {{
+                        request = request.query(&[("cursor", c)]);
+                    }}
+                    request
+                }})
+                .await?;
+
+            let page = projection.parse_page(&text, "results")?;
+            all_results.extend(page.rows);
+
+            cursor = match page.next_cursor {{
+                Some(next) if !next.is_empty() && seen.insert(next.clone()) => Some(next),
+                Some(next) if !next.is_empty() => {{
+                    tracing::warn!("API returned cursor '{{}}' again; stopping pagination", next);
+                    None
+                }}
+                _ => None,
+            }};
+
+            if cursor.is_none() {{
+                break;
+            }}
+        }}
+
+        Ok(all_results)
+    }}
+
+    /// Total in-flight requests the pool allows.
+    pub fn concurrency(&self) -> usize {{
+        self.endpoints.iter().map(|ep| ep.concurrency).sum()
+    }}
+
+    /// Send a request through the next endpoint.
+    async fn send<F>(&self, build: F) -> Result<String>
+    where
+        F: FnOnce(&Endpoint) -> reqwest::RequestBuilder,
+    {{
+        self.send_via(self.pick(), build).await
+    }}
+
+    /// Send a request through `endpoint`, waiting for a free slot and for
+    /// its rate limit.
+    async fn send_via<F>(&self, endpoint: &Endpoint, build: F) -> Result<String>
+    where
+        F: FnOnce(&Endpoint) -> reqwest::RequestBuilder,
+    {{
+        let _permit = endpoint.permits.acquire().await?;
+        if let Some(limiter) = &endpoint.limiter {{
+            limiter.wait().await;
+        }}
+
+        tracing::debug!(profile = %endpoint.name, "sending request");
+        let response = build(endpoint).send().await?;
+        self.handle_response(response).await
+    }}
+
+    fn pick(&self) -> &Endpoint {{
+        let len = self.endpoints.len();
+        let start = self.next.fetch_add(1, Ordering::Relaxed) % len;
+        match self.balance {{
+            Balance::RoundRobin => &self.endpoints[start],
+            // Rotating the scan start spreads ties across endpoints
+            Balance::LeastLoaded => (0..len)
+                .map(|i| &self.endpoints[(start + i) % len])
+                .min_by_key(|ep| ep.in_flight())
+                .unwrap_or(&self.endpoints[start]),
+        }}
+    }}
+
+    /// Return the raw body; parsing is left to the caller's `Projection`.
+    async fn handle_response(&self, response: reqwest::Response) -> Result<String> {{
+        let status = response.status();
+        let text = response.text().await?;
+
+        if !status.is_success() {{
+            anyhow::bail!("API error ({{}}): {{}}", status, text);
+        }}
+
+        Ok(text)
+    }}
+}}
+
+impl Endpoint {{
+    fn new(name: String, profile: &Profile) -> Result<Self> {{
+        let api_key = profile
+            .api_key
+            .as_deref()
+            .with_context(|| format!("API key not configured for profile '{{}}'", name))?;
 
         let mut headers = HeaderMap::new();
         headers.insert(
@@ -497,41 +1514,50 @@ impl Client {{
             .timeout(std::time::Duration::from_secs(30))
             .build()?;
 
-        let base_url = config.domain
+        let base_url = profile.domain
             .as_deref()
             .unwrap_or("https://api.example.com")
             .to_string();
 
-        Ok(Self {{ http, base_url }})
-    }}
+        let concurrency = profile.concurrency.unwrap_or(DEFAULT_CONCURRENCY).max(1);
 
-    pub async fn get(&self, id: &str) -> Result<Value> {{
-        let url = format!("{{}}/items/{{}}", self.base_url, id);
-        let response = self.http.get(&url).send().await?;
-        self.handle_response(response).await
+        Ok(Self {{
+            name,
+            http,
+            base_url,
+            concurrency,
+            permits: Semaphore::new(concurrency),
+            limiter: profile.rate_per_minute.and_then(RateLimiter::per_minute),
+        }})
     }}
 
-    pub async fn search(&self, query: &str, limit: u32) -> Result<Vec<Value>> {{
-        let url = format!("{{}}/search", self.base_url);
-        let response = self.http
-            .get(&url)
-            .query(&[("q", query), ("limit", &limit.to_string())])
-            .send()
-            .await?;
-
-        let data = self.handle_response(response).await?;
-        Ok(data["results"].as_array().cloned().unwrap_or_default())
+    fn in_flight(&self) -> usize {{
+        self.concurrency - self.permits.available_permits()
     }}
+}}
 
-    async fn handle_response(&self, response: reqwest::Response) -> Result<Value> {{
-        let status = response.status();
-        let text = response.text().await?;
+/// Spaces requests evenly to stay under a per-minute quota.
+struct RateLimiter {{
+    interval: Duration,
+    next: Mutex<Instant>,
+}}
 
-        if !status.is_success() {{
-            anyhow::bail!("API error ({{}}): {{}}", status, text);
-        }}
+impl RateLimiter {{
+    fn per_minute(rate: u32) -> Option<Self> {{
+        (rate > 0).then(|| Self {{
+            interval: Duration::from_secs(60) / rate,
+            next: Mutex::new(Instant::now()),
+        }})
+    }}
 
-        serde_json::from_str(&text).context("Failed to parse response")
+    async fn wait(&self) {{
+        let slot = {{
+            let mut next = self.next.lock().await;
+            let slot = (*next).max(Instant::now());
+            *next = slot + self.interval;
+            slot
+        }};
+        tokio::time::sleep_until(slot).await;
     }}
 }}
 '''
@@ -545,6 +1571,8 @@ pub struct Item {{
     pub name: String,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub description: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub updated_at: Option<String>,
 }}
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -576,12 +1604,18 @@ CLI for {api_name} API.
 # Get item by ID
 {cli_name} get <id> --format json
 
+# Get several items concurrently (spread over config profiles)
+{cli_name} get <id1> <id2> <id3> --json
+
 # Search
 {cli_name} search "query" --limit 20
 
 # Search with JSON output (for parsing)
 {cli_name} search "query" --json | jq '.[0].id'
-```
+
+# Select fields and filter rows without jq
+{cli_name} search "query" --json --fields id,name --filter status=open
+{skill_store_commands}```
 
 ## Options
 
@@ -590,7 +1624,11 @@ CLI for {api_name} API.
 | `--json` | Output as JSON |
 | `--format` | Output format: json, table, markdown |
 | `--limit N` | Maximum results |
-| `--stream` | Real-time streaming |
+| `--fields a,b.c` | Only output these fields |
+| `--filter k=v` | Keep matching results (`=`, `!=`, `~` contains; any array element) |
+| `--profile a,b` | Config profile(s) to send requests through |
+| `--all` | Fetch every page |
+{skill_store_options}| `--stream` | Real-time streaming |
 
 ## Configuration
 
@@ -615,10 +1653,10 @@ src/
 ├── main.rs          # CLI entry, command dispatch
 ├── cli.rs           # Clap command definitions
 ├── config.rs        # 4-tier config: CLI > ENV > project > global
-├── format.rs        # Output formatting (JSON/table)
-└── {api_module}/
+├── format.rs        # Output formatting, --fields/--filter projection
+{claude_store_file}└── {api_module}/
     ├── mod.rs       # Module exports
-    ├── client.rs    # HTTP client, API methods
+    ├── client.rs    # Endpoint pool, API methods
     └── types.rs     # Data structures
 ```
 
@@ -632,7 +1670,26 @@ let api_key = cli_api_key
     .or_else(|| file_config.api_key);
 ```
 
-### Adding Commands
+### Client Pool
+```toml
+# Each profile gets its own key, base URL and limits
+[profiles.us]
+api_key = "..."
+domain = "https://us.api.example.com"
+concurrency = 8
+rate_per_minute = 600
+
+[defaults]
+balance = "least-loaded"  # or "round-robin"
+```
+`--profile us,eu` restricts the pool; without it every profile is used.
+`--api-key` replaces every profile's key; `{env_var}` only fills in for
+profiles without one. `get <id>...` fans out
+with `Client::get_many`. New client methods should go through
+`Client::send` so limits apply; paginated walks use `send_via` to stay on
+one endpoint.
+
+{claude_store_section}### Adding Commands
 
 1. `cli.rs`: Add variant to `Command` enum
 2. `main.rs`: Add match arm
@@ -646,6 +1703,94 @@ cargo clippy && cargo fmt
 ```
 '''
 
+# Template: [profile.release-fast-build] (--profile-preset fast-build)
+PROFILE_FAST_BUILD_TOML = '''
+[profile.release-fast-build]
+inherits = "release"
+lto = "thin"
+codegen-units = 16
+'''
+
+# Template: [profile.release-small] (--profile-preset small)
+PROFILE_SMALL_TOML = '''
+[profile.release-small]
+inherits = "release"
+opt-level = "z"
+panic = "abort"
+'''
+
+# Template: [profile.release-pgo] (--profile-preset pgo)
+PROFILE_PGO_TOML = '''
+[profile.release-pgo]
+inherits = "release"
+'''
+
+# Template: pgo.sh (--profile-preset pgo)
+PGO_SH = '''#!/usr/bin/env bash
+# Profile-guided optimization build for {cli_name}.
+#
+# 1. Builds an instrumented binary
+# 2. Runs every line of pgo-train.txt against it
+# 3. Rebuilds with the merged profile: target/pgo/<host>/release-pgo/{cli_name}
+#
+# Requires: rustup component add llvm-tools-preview
+set -euo pipefail
+cd "$(dirname "$0")"
+
+PROFILE_DIR="$PWD/target/pgo-profiles"
+# An explicit --target keeps RUSTFLAGS off build scripts and proc-macros
+TARGET="$(rustc -vV | sed -n 's/^host: //p')"
+LLVM_PROFDATA="$(find "$(rustc --print sysroot)" -name llvm-profdata -type f | head -n 1)"
+
+if [ -z "$LLVM_PROFDATA" ]; then
+    echo "llvm-profdata not found. Run: rustup component add llvm-tools-preview" >&2
+    exit 1
+fi
+
+rm -rf "$PROFILE_DIR"
+
+RUSTFLAGS="-Cprofile-generate=$PROFILE_DIR" \\
+    cargo build --profile release-pgo --target "$TARGET" --target-dir target/pgo-instrumented
+
+BIN="target/pgo-instrumented/$TARGET/release-pgo/{cli_name}"
+while IFS= read -r line; do
+    case "$line" in ''|'#'*) continue ;; esac
+    echo "train: {cli_name} $line"
+    # shellcheck disable=SC2086
+    "$BIN" $line > /dev/null 2>&1 || true
+done < pgo-train.txt
+
+"$LLVM_PROFDATA" merge -o "$PROFILE_DIR/merged.profdata" "$PROFILE_DIR"
+
+RUSTFLAGS="-Cprofile-use=$PROFILE_DIR/merged.profdata" \\
+    cargo build --profile release-pgo --target "$TARGET" --target-dir target/pgo
+
+echo "PGO binary: target/pgo/$TARGET/release-pgo/{cli_name}"
+'''
+
+# Template: pgo-train.txt (--profile-preset pgo)
+PGO_TRAIN_TXT = '''# Training workload for pgo.sh: one {cli_name} invocation per line.
+# Point the config domain at a test server first; failed runs are ignored.
+--help
+search example --limit 100 --json
+search example --limit 100
+search example --limit 100 --json --fields id,name
+get example-id --json
+'''
+
+PROFILE_PRESETS = {
+    'fast-build': PROFILE_FAST_BUILD_TOML,
+    'small': PROFILE_SMALL_TOML,
+    'pgo': PROFILE_PGO_TOML,
+}
+
+# --allocator name -> (Cargo.toml dependency, main.rs declaration)
+ALLOCATORS = {
+    'mimalloc': (
+        '\n# Global allocator\nmimalloc = { version = "0.1", default-features = false }\n',
+        '\n#[global_allocator]\nstatic GLOBAL: mimalloc::MiMalloc = mimalloc::MiMalloc;\n',
+    ),
+}
 
 def to_snake_case(name: str) -> str:
     """Convert hyphenated name to snake_case for Rust modules."""
@@ -674,7 +1819,14 @@ def extract_api_module_name(cli_name: str) -> str:
     return to_snake_case(base_name)
 
 
-def init_rust_cli(cli_name: str, api_name: str, path: str) -> Path | None:
+def init_rust_cli(
+    cli_name: str,
+    api_name: str,
+    path: str,
+    profile_presets: list[str] | None = None,
+    allocator: str | None = None,
+    local_store: bool = False,
+) -> Path | None:
     """
     Initialize a new Rust CLI project.
 
@@ -682,6 +1834,9 @@ def init_rust_cli(cli_name: str, api_name: str, path: str) -> Path | None:
         cli_name: Name of the CLI (hyphen-case)
         api_name: Name of the API (PascalCase)
         path: Output directory path
+        profile_presets: Extra Cargo profiles (fast-build, small, pgo)
+        allocator: Alternative global allocator (mimalloc)
+        local_store: Generate the local store (sync, --local)
 
     Returns:
         Path to created project, or None if error
@@ -689,11 +1844,24 @@ def init_rust_cli(cli_name: str, api_name: str, path: str) -> Path | None:
     project_dir = Path(path).resolve() / cli_name
     api_module = extract_api_module_name(cli_name)
     env_var = to_env_var(cli_name)
+    profile_presets = list(dict.fromkeys(profile_presets or []))
 
     if project_dir.exists():
         print(f"Error: Directory already exists: {project_dir}")
         return None
 
+    unknown = [p for p in profile_presets if p not in PROFILE_PRESETS]
+    if unknown:
+        print(f"Error: Unknown profile preset: {', '.join(unknown)} "
+              f"(choose from {', '.join(PROFILE_PRESETS)})")
+        return None
+
+    if allocator and allocator not in ALLOCATORS:
+        print(f"Error: Unknown allocator: {allocator} (choose from {', '.join(ALLOCATORS)})")
+        return None
+
+    allocator_dependency, global_allocator = ALLOCATORS.get(allocator, ('', ''))
+
     try:
         # Create directory structure
         (project_dir / 'src' / api_module).mkdir(parents=True)
@@ -705,7 +1873,11 @@ def init_rust_cli(cli_name: str, api_name: str, path: str) -> Path | None:
             'api_name': api_name,
             'api_module': api_module,
             'env_var': env_var,
+            'allocator_dependency': allocator_dependency,
+            'global_allocator': global_allocator,
         }
+        for name, fragment in LOCAL_STORE_FRAGMENTS.items():
+            vars[name] = fragment.format(**vars) if local_store else ''
 
         # Write files
         files = {
@@ -722,12 +1894,25 @@ def init_rust_cli(cli_name: str, api_name: str, path: str) -> Path | None:
             'CLAUDE.md': CLAUDE_MD,
         }
 
+        for preset in profile_presets:
+            files['Cargo.toml'] += PROFILE_PRESETS[preset]
+
+        if local_store:
+            files['src/store.rs'] = STORE_RS
+
+        if 'pgo' in profile_presets:
+            files['pgo.sh'] = PGO_SH
+            files['pgo-train.txt'] = PGO_TRAIN_TXT
+
         for file_path, template in files.items():
             full_path = project_dir / file_path
             content = template.format(**vars)
             full_path.write_text(content)
             print(f"  Created {file_path}")
 
+        if 'pgo' in profile_presets:
+            (project_dir / 'pgo.sh').chmod(0o755)
+
         print(f"\nProject initialized: {project_dir}")
         print("\nNext steps:")
         print(f"  1. cd {project_dir}")
@@ -742,12 +1927,191 @@ def init_rust_cli(cli_name: str, api_name: str, path: str) -> Path | None:
         return None
 
 
+def shared_cache_root(project_dirs: list[Path]) -> Path | None:
+    """Directory holding the shared target dir and vendor cache.
+
+    This is the common parent of all projects, so a batch generated with the
+    same --path shares one cache next to the projects. Returns None when the
+    projects only share a filesystem root.
+    """
+    root = Path(os.path.commonpath([str(d.parent) for d in project_dirs]))
+    return None if root.parent == root else root
+
+
+def vendor_config_args(vendor_dir: Path) -> list[str]:
+    """`cargo --config` flags that build from vendor_dir for one invocation."""
+    return [
+        '--config', 'source.crates-io.replace-with="vendored-sources"',
+        '--config', f'source.vendored-sources.directory={json.dumps(vendor_dir.as_posix())}',
+    ]
+
+
+def run_cargo(args: list[str], project_dir: Path, env: dict) -> tuple[bool, float, str]:
+    """Run a cargo command in project_dir. Returns (ok, seconds, stderr)."""
+    start = time.monotonic()
+    proc = subprocess.run(
+        ['cargo', *args],
+        cwd=project_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    return proc.returncode == 0, time.monotonic() - start, proc.stderr
+
+
+def warm_projects(
+    project_dirs: list[Path],
+    vendor: bool = False,
+    check: bool = True,
+    cache_dir: Path | None = None,
+) -> bool:
+    """
+    Pre-build the dependency tree of generated projects.
+
+    All projects share one CARGO_TARGET_DIR, so the common dependencies
+    (tokio, reqwest, clap, serde) compile once per batch instead of once per
+    project. Cargo locks a shared target dir per build, so projects are
+    warmed one after another: the first pays for the dependency tree and the
+    rest only compile their own crate.
+
+    Nothing is written into the projects. The shared directories apply to
+    the warm-up commands only; the hints printed at the end show how to
+    reuse them.
+
+    Args:
+        project_dirs: Generated project directories
+        vendor: Vendor dependencies into a shared cache and check offline
+        check: Run `cargo check` after fetching
+        cache_dir: Where to put the shared directories (default: the
+            projects' common parent)
+
+    Returns:
+        True if every project warmed successfully
+    """
+    if shutil.which('cargo') is None:
+        print("Error: cargo not found in PATH")
+        return False
+
+    project_dirs = [d.resolve() for d in project_dirs]
+    missing = [d for d in project_dirs if not (d / 'Cargo.toml').exists()]
+    if missing:
+        for d in missing:
+            print(f"Error: No Cargo.toml in {d}")
+        return False
+
+    cache_root = cache_dir.resolve() if cache_dir else shared_cache_root(project_dirs)
+    if cache_root is None:
+        print("Error: Projects have no common parent directory. Pass --cache-dir <dir>")
+        return False
+
+    target_dir = cache_root / '.cargo-target'
+    vendor_dir = cache_root / '.cargo-vendor' if vendor else None
+
+    env = dict(os.environ, CARGO_TARGET_DIR=str(target_dir))
+
+    print(f"\nWarming {len(project_dirs)} project(s)")
+    print(f"  Target dir: {target_dir}")
+
+    if vendor_dir:
+        print(f"  Vendor dir: {vendor_dir}")
+        sync_args = []
+        for d in project_dirs[1:]:
+            sync_args += ['--sync', str(d / 'Cargo.toml')]
+        ok, elapsed, stderr = run_cargo(
+            ['vendor', '--versioned-dirs', '--respect-source-config', *sync_args, str(vendor_dir)],
+            project_dirs[0],
+            env,
+        )
+        if not ok:
+            print(f"Error: cargo vendor failed after {elapsed:.1f}s")
+            print(stderr.strip())
+            return False
+        print(f"  Vendored in {elapsed:.1f}s")
+
+    steps = [] if vendor_dir else [['fetch']]
+    if check:
+        if vendor_dir:
+            steps.append([*vendor_config_args(vendor_dir), 'check', '--offline'])
+        else:
+            steps.append(['check'])
+
+    all_ok = True
+    width = max(len(d.name) for d in project_dirs)
+    for project_dir in project_dirs:
+        timings = []
+        error = None
+        for args in steps:
+            ok, elapsed, stderr = run_cargo(args, project_dir, env)
+            timings.append((next(a for a in args if a in ('fetch', 'check')), elapsed))
+            if not ok:
+                error = stderr
+                break
+
+        times = '  '.join(f"{step} {secs:.1f}s" for step, secs in timings)
+        status = 'ok' if error is None else 'FAILED'
+        print(f"  {status:<6} {project_dir.name:<{width}}  {times}")
+        if error is not None:
+            all_ok = False
+            print('\n'.join(f"         {line}" for line in error.strip().splitlines()[-10:]))
+
+    print("\nTo reuse the compiled dependencies in later builds:")
+    print(f"  export CARGO_TARGET_DIR={target_dir}")
+    if vendor_dir:
+        print("To build offline from the vendor cache:")
+        print(f"  {shlex.join(['cargo', *vendor_config_args(vendor_dir), 'build', '--offline'])}")
+
+    return all_ok
+
+
+def parse_option(name: str, default: str | None = None) -> str | None:
+    """Return the value following a command line option, if present."""
+    if name not in sys.argv:
+        return default
+    idx = sys.argv.index(name) + 1
+    if idx >= len(sys.argv):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    return sys.argv[idx]
+
+
 def main():
+    cache_dir = parse_option('--cache-dir')
+    cache_dir = Path(cache_dir) if cache_dir else None
+
+    if sys.argv[1:2] == ['--warm']:
+        flags = {'--vendor', '--fetch-only'}
+        project_dirs = []
+        args = iter(sys.argv[2:])
+        for arg in args:
+            if arg == '--cache-dir':
+                next(args, None)
+            elif arg.startswith('--') and arg not in flags:
+                print(f"Error: Unknown option: {arg}")
+                sys.exit(1)
+            elif arg not in flags:
+                project_dirs.append(Path(arg))
+
+        if not project_dirs:
+            print("Usage: init_rust_cli.py --warm <project-dir>... [--vendor] [--fetch-only] [--cache-dir DIR]")
+            sys.exit(1)
+
+        ok = warm_projects(
+            project_dirs,
+            vendor='--vendor' in sys.argv,
+            check='--fetch-only' not in sys.argv,
+            cache_dir=cache_dir,
+        )
+        sys.exit(0 if ok else 1)
+
     if len(sys.argv) < 6 or '--api-name' not in sys.argv or '--path' not in sys.argv:
-        print("Usage: init_rust_cli.py <cli-name> --api-name <ApiName> --path <output-dir>")
+        print("Usage: init_rust_cli.py <cli-name> --api-name <ApiName> --path <output-dir> [--warm]")
+        print("                        [--profile-preset fast-build,small,pgo] [--allocator mimalloc]")
+        print("                        [--local-store]")
+        print("       init_rust_cli.py --warm <project-dir>... [--vendor] [--fetch-only] [--cache-dir DIR]")
         print("\nExamples:")
         print("  init_rust_cli.py notion-cli --api-name Notion --path ~/projects")
-        print("  init_rust_cli.py github-cli --api-name GitHub --path .")
+        print("  init_rust_cli.py github-cli --api-name GitHub --path . --warm")
+        print("  init_rust_cli.py --warm ~/projects/notion-cli ~/projects/github-cli --vendor")
         sys.exit(1)
 
     cli_name = sys.argv[1]
@@ -757,10 +2121,28 @@ def main():
     api_name = sys.argv[api_name_idx]
     path = sys.argv[path_idx]
 
+    presets = parse_option('--profile-preset')
+    allocator = parse_option('--allocator')
+
     print(f"Initializing {cli_name} for {api_name} API...")
     print(f"Location: {path}\n")
 
-    result = init_rust_cli(cli_name, api_name, path)
+    result = init_rust_cli(
+        cli_name,
+        api_name,
+        path,
+        profile_presets=presets.split(',') if presets else None,
+        allocator=allocator,
+        local_store='--local-store' in sys.argv,
+    )
+    if result and '--warm' in sys.argv:
+        ok = warm_projects(
+            [result],
+            vendor='--vendor' in sys.argv,
+            check='--fetch-only' not in sys.argv,
+            cache_dir=cache_dir,
+        )
+        sys.exit(0 if ok else 1)
     sys.exit(0 if result else 1)
 
 